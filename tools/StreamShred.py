@@ -21,10 +21,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 What it does:
 - 3–7 passes (configurable), each pass writes cryptographically strong random bytes in chunks.
+  (AES-256-CTR keystream keyed from os.urandom when the optional `cryptography` package is
+  installed; otherwise os.urandom directly.)
 - Optional verification: reads back N small samples per pass and compares to what was written.
   (Captures only the expected bytes for those samples during streaming; no large RAM usage.)
 - Rename -> truncate -> unlink (delete) with fsync best-effort.
-- Linux-only cache hint: posix_fadvise(POSIX_FADV_DONTNEED) to attempt to free cached pages.
+- Linux-only cache hints: posix_fadvise(POSIX_FADV_SEQUENTIAL) on open, and with --drop-cache
+  posix_fadvise(POSIX_FADV_DONTNEED) every 64 MiB and after each pass to free cached pages.
 
 Important SSD/NVMe note:
 - On SSD/NVMe (including most M.2), file-level overwriting is best-effort; controllers abstract
@@ -36,20 +39,68 @@ Important SSD/NVMe note:
 from __future__ import annotations
 
 import argparse
+import bisect
+import concurrent.futures
+import contextlib
+import errno
+import io
+import mmap
 import os
+import queue
 import secrets
+import struct
 import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, TextIO, Tuple, Union
+
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:  # optional: fall back to os.urandom
+    Cipher = None
 
 APP_NAME = "StreamShred"
 
+# Random bytes are fetched from the OS in batches of this size and handed
+# out to the overwrite loop as slices.
+RANDOM_POOL_SIZE = 16 * 1024 * 1024
+
+# With --drop-cache, already-written pages are dropped every this many bytes during a
+# pass, so the page cache never grows to the file size.
+DROP_CACHE_INTERVAL = 64 * 1024 * 1024
+
+# Verification read-back: samples (sorted) whose combined span fits in this many bytes
+# are fetched with a single pread.
+VERIFY_READ_SPAN = 64 * 1024
+
+# Chunks submitted per vectored write syscall (pwritev).
+WRITE_BATCH = 4
+
+# Chunk buffers shared by the RNG producer thread and the writer: one full write batch
+# being written plus up to this many more generated ahead.
+PREFETCH_SLOTS = WRITE_BATCH + 4
+
+# O_DIRECT needs buffer addresses, file offsets and lengths aligned to the logical block
+# size; 4096 covers both 512e and 4Kn devices.
+DIRECT_IO_ALIGN = 4096
+
 # -------------------------
 # Helpers: fsync + cache hints
 # -------------------------
 
 
+_LOG_LOCK = threading.Lock()
+
+
+def log(message: str, stream: Optional[TextIO] = None) -> None:
+    """Print one whole status line; --jobs/--pass-threads workers can't interleave it."""
+    stream = stream or sys.stdout
+    with _LOG_LOCK:
+        stream.write(message + "\n")
+        stream.flush()
+
+
 def fsync_dir_best_effort(directory: Path) -> None:
     """POSIX best-effort fsync of the directory to persist rename/unlink metadata."""
     if os.name != "posix":
@@ -64,7 +115,7 @@ def fsync_dir_best_effort(directory: Path) -> None:
         pass
 
 
-def linux_drop_page_cache_best_effort(fd: int, file_size: int) -> None:
+def linux_drop_page_cache_best_effort(fd: int, length: int, offset: int = 0) -> None:
     """
     Linux-only best-effort: posix_fadvise(..., DONTNEED) attempts to free cached pages
     for the specified region.
@@ -76,17 +127,141 @@ def linux_drop_page_cache_best_effort(fd: int, file_size: int) -> None:
             return
 
         page = os.sysconf("SC_PAGESIZE") if hasattr(os, "sysconf") else 4096
-        off = 0
-        length = ((file_size + page - 1) // page) * page
-        os.posix_fadvise(fd, off, length, os.POSIX_FADV_DONTNEED)
+        off = (offset // page) * page
+        end = ((offset + length + page - 1) // page) * page
+        os.posix_fadvise(fd, off, end - off, os.POSIX_FADV_DONTNEED)
     except Exception:
         pass
 
 
+def linux_advise_sequential_best_effort(fd: int) -> None:
+    """
+    Linux-only best-effort: posix_fadvise(..., SEQUENTIAL) for the whole file, since
+    every pass streams it front to back.
+    """
+    try:
+        if not (hasattr(os, "posix_fadvise") and hasattr(os, "POSIX_FADV_SEQUENTIAL")):
+            return
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except Exception:
+        pass
+
+
+def open_for_overwrite(path: Path, o_direct: bool) -> Tuple[io.FileIO, bool]:
+    """
+    Open `path` read/write and unbuffered. With o_direct (Linux), try O_DIRECT first and
+    fall back to normal I/O if the filesystem rejects it (EINVAL, e.g. tmpfs).
+    Returns (file, direct_enabled).
+    """
+    if o_direct and hasattr(os, "O_DIRECT"):
+        try:
+            fd = os.open(str(path), os.O_RDWR | os.O_DIRECT)
+        except OSError as e:
+            if e.errno != errno.EINVAL:
+                raise
+            log(f"[!] {APP_NAME}: O_DIRECT not supported for {path}; using buffered I/O.")
+        else:
+            return os.fdopen(fd, "r+b", buffering=0), True
+    elif o_direct:
+        log(f"[!] {APP_NAME}: O_DIRECT not available on this platform; using buffered I/O.")
+    return open(path, "r+b", buffering=0), False
+
+
+def set_direct_io(fd: int, enabled: bool) -> None:
+    """Toggle O_DIRECT on an open fd (Linux), e.g. for an unaligned tail write."""
+    import fcntl
+
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    if enabled:
+        flags |= os.O_DIRECT
+    else:
+        flags &= ~os.O_DIRECT
+    fcntl.fcntl(fd, fcntl.F_SETFL, flags)
+
+
+def read_direct(f: io.FileIO, offset: int, length: int, buf: mmap.mmap) -> bytes:
+    """
+    Read `length` bytes at `offset` from an O_DIRECT file by reading the enclosing
+    aligned span into the page-aligned `buf`.
+    """
+    start = offset - offset % DIRECT_IO_ALIGN
+    end = -(-(offset + length) // DIRECT_IO_ALIGN) * DIRECT_IO_ALIGN
+    view = memoryview(buf)[: end - start]
+    if hasattr(os, "preadv"):
+        os.preadv(f.fileno(), [view], start)
+    else:
+        f.seek(start)
+        f.readinto(view)
+    return buf[offset - start : offset - start + length]
+
+
 def rand_name_hex(nbytes: int = 16) -> str:
     return secrets.token_hex(nbytes)
 
 
+class _RandomPool:
+    """
+    Batches os.urandom calls: one large read from the OS, then zero-copy
+    memoryview slices of it for each chunk. Refills when exhausted.
+    """
+
+    def __init__(self, size: int = RANDOM_POOL_SIZE) -> None:
+        self._size = size
+        self._buf = memoryview(b"")
+        self._pos = 0
+
+    def refill(self, min_size: int = 0) -> None:
+        self._buf = memoryview(os.urandom(max(self._size, min_size)))
+        self._pos = 0
+
+    def get(self, n: int, out: Optional[memoryview] = None) -> memoryview:
+        """Next n bytes, as a slice of the pool or (if given) copied into out[:n]."""
+        if self._pos + n > len(self._buf):
+            self.refill(n)
+        data = self._buf[self._pos : self._pos + n]
+        self._pos += n
+        if out is None:
+            return data
+        out[:n] = data
+        return out[:n]
+
+
+class _KeystreamSource:
+    """
+    AES-256-CTR keystream (encrypting zeros) under a fresh os.urandom key.
+    Same output quality as a CSPRNG, but runs at AES-NI speed instead of
+    being bound by the kernel RNG.
+    """
+
+    # update_into() needs this much room past the input length.
+    OUT_SLACK = 15
+
+    def __init__(self) -> None:
+        key = os.urandom(32)
+        nonce = os.urandom(16)
+        self._enc = Cipher(algorithms.AES(key), modes.CTR(nonce)).encryptor()
+        self._zeros = memoryview(b"")
+
+    def get(self, n: int, out: Optional[memoryview] = None) -> Union[bytes, memoryview]:
+        """
+        Next n keystream bytes. With `out` (n + OUT_SLACK bytes or more), the keystream
+        is generated straight into it by OpenSSL and out[:n] is returned.
+        """
+        if n > len(self._zeros):
+            self._zeros = memoryview(bytes(n))
+        if out is None:
+            return self._enc.update(self._zeros[:n])
+        self._enc.update_into(self._zeros[:n], out)
+        return out[:n]
+
+
+def new_random_source(size: int) -> Union[_KeystreamSource, _RandomPool]:
+    """Independent random byte source for one pass over `size` bytes."""
+    if Cipher is not None:
+        return _KeystreamSource()
+    return _RandomPool(min(RANDOM_POOL_SIZE, size))
+
+
 # -------------------------
 # Verification sampling
 # -------------------------
@@ -99,30 +274,40 @@ class Sample:
 
 
 def choose_samples(file_size: int, sample_count: int, sample_len: int) -> List[Sample]:
+    """Random equal-length samples, sorted by offset (so their ends are sorted too)."""
     if file_size <= 0 or sample_count <= 0 or sample_len <= 0:
         return []
     sample_len = min(sample_len, file_size)
-    samples: List[Sample] = []
-    for _ in range(sample_count):
-        start = secrets.randbelow(file_size - sample_len + 1)
-        samples.append(Sample(offset=start, length=sample_len))
-    return samples
+    span = file_size - sample_len + 1
+    # One os.urandom draw for all offsets; the modulo bias is irrelevant for sample
+    # positions (they're not secrets, just spread over the file).
+    rnd = os.urandom(8 * sample_count)
+    offsets = sorted(v % span for (v,) in struct.iter_unpack("<Q", rnd))
+    return [Sample(offset=o, length=sample_len) for o in offsets]
 
 
 def capture_expected_from_chunk(
     samples: List[Sample],
-    expected: List[bytearray],
-    filled: List[bytearray],
-    chunk_data: bytes,
+    expected: List[memoryview],
+    filled_count: List[int],
+    chunk_data: Union[bytes, memoryview],
     chunk_start: int,
+    lo: int = 0,
+    hi: Optional[int] = None,
 ) -> None:
     """
     As we stream-write, record the expected bytes for any sample ranges that overlap this chunk.
     expected[i] holds the expected bytes for sample i.
-    filled[i] is a bytearray mask (0/1) to track which bytes in expected[i] have been filled.
+    filled_count[i] counts the bytes of expected[i] filled so far; chunks never overlap,
+    so the sample is fully captured once it equals the sample length.
+    Only samples[lo:hi] are considered (the caller's window of samples that can overlap).
     """
-    chunk_end = chunk_start + len(chunk_data)
-    for i, s in enumerate(samples):
+    mv = memoryview(chunk_data)
+    chunk_end = chunk_start + len(mv)
+    if hi is None:
+        hi = len(samples)
+    for i in range(lo, hi):
+        s = samples[i]
         s_start = s.offset
         s_end = s.offset + s.length
         if s_end <= chunk_start or s_start >= chunk_end:
@@ -136,12 +321,46 @@ def capture_expected_from_chunk(
         chunk_i0 = overlap_start - chunk_start
         chunk_i1 = overlap_end - chunk_start
 
-        expected[i][sample_i0:sample_i1] = chunk_data[chunk_i0:chunk_i1]
-        filled[i][sample_i0:sample_i1] = b"\x01" * (sample_i1 - sample_i0)
+        expected[i][sample_i0:sample_i1] = mv[chunk_i0:chunk_i1]
+        filled_count[i] += sample_i1 - sample_i0
 
 
-def all_filled(mask: bytearray) -> bool:
-    return all(b == 1 for b in mask)
+def read_samples(
+    f: io.FileIO, samples: List[Sample], direct: bool, direct_buf: Optional[mmap.mmap]
+) -> List[bytes]:
+    """
+    Read back the current bytes of each (offset-sorted) sample. Uses positional
+    pread (no seeks), and one read for any run of samples spanning at most
+    VERIFY_READ_SPAN bytes. O_DIRECT files go through read_direct instead.
+    Without os.pread (Windows), falls back to seek + read per sample.
+    """
+    if direct:
+        return [read_direct(f, s.offset, s.length, direct_buf) for s in samples]
+    out: List[bytes] = []
+    if not hasattr(os, "pread"):
+        for s in samples:
+            f.seek(s.offset)
+            out.append(f.read(s.length))
+        return out
+
+    fd = f.fileno()
+    i = 0
+    while i < len(samples):
+        span_start = samples[i].offset
+        span_end = span_start + samples[i].length
+        j = i + 1
+        while j < len(samples):
+            end = max(span_end, samples[j].offset + samples[j].length)
+            if end - span_start > VERIFY_READ_SPAN:
+                break
+            span_end = end
+            j += 1
+        span = os.pread(fd, span_end - span_start, span_start)
+        for s in samples[i:j]:
+            rel = s.offset - span_start
+            out.append(span[rel : rel + s.length])
+        i = j
+    return out
 
 
 # -------------------------
@@ -157,6 +376,176 @@ def build_pass_count(min_passes: int, max_passes: int, randomize: bool) -> int:
     return min_passes + secrets.randbelow(max_passes - min_passes + 1)
 
 
+def pwrite_all(fd: int, bufs: List[memoryview], offset: int) -> None:
+    """
+    Write `bufs` back to back at `offset`: one vectored pwritev(2) where available
+    (else lseek + write per buffer), retrying any short write.
+    """
+    views = list(bufs)
+    while views:
+        if hasattr(os, "pwritev"):
+            n = os.pwritev(fd, views, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            n = os.write(fd, views[0])
+        if n <= 0:
+            raise OSError(errno.EIO, "write made no progress")
+        offset += n
+        while views and n >= len(views[0]):
+            n -= len(views[0])
+            views.pop(0)
+        if n:
+            views[0] = views[0][n:]
+
+
+@dataclass
+class _Region:
+    """A byte range [start, end) of the target, overwritten through its own fd."""
+
+    f: io.FileIO
+    direct: bool
+    start: int
+    end: int
+    # PREFETCH_SLOTS reusable chunk buffers, cycled between the producer thread and the
+    # writer. The keystream is generated straight into them, and O_DIRECT writes need
+    # them page-aligned (anonymous mmap). The os.urandom pool in buffered mode hands out
+    # zero-copy slices instead, so its slots are None.
+    slots: List[Optional[memoryview]]
+
+
+def new_region(
+    f: io.FileIO, direct: bool, start: int, end: int, chunk_size: int
+) -> _Region:
+    slot_len = min(chunk_size, end - start) + _KeystreamSource.OUT_SLACK
+    slots: List[Optional[memoryview]]
+    if direct:
+        slots = [memoryview(mmap.mmap(-1, slot_len)) for _ in range(PREFETCH_SLOTS)]
+    elif Cipher is not None:
+        slots = [memoryview(bytearray(slot_len)) for _ in range(PREFETCH_SLOTS)]
+    else:
+        slots = [None] * PREFETCH_SLOTS
+    return _Region(f=f, direct=direct, start=start, end=end, slots=slots)
+
+
+def overwrite_region(
+    region: _Region,
+    chunk_size: int,
+    samples: List[Sample],
+    expected: List[memoryview],
+    filled_count: List[int],
+    drop_cache_linux: bool,
+) -> None:
+    """
+    One pass of random data over region.start..region.end, capturing expected bytes for
+    `samples` (sorted, all inside the region). Uses its own random source, and submits
+    up to WRITE_BATCH chunks per write syscall.
+
+    Random generation runs in a producer thread that keeps up to PREFETCH_SLOTS chunks
+    ready, so a pass takes max(generate, write) rather than their sum.
+    """
+    fd = region.f.fileno()
+    source = new_random_source(region.end - region.start)
+
+    # Free slots flow producer-ward; filled (offset, data, slot) items flow back.
+    # None on `ready` marks the end of the region; an exception is re-raised here.
+    free: "queue.Queue[Optional[memoryview]]" = queue.Queue()
+    ready: queue.Queue = queue.Queue()
+    for slot in region.slots:
+        free.put(slot)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            off = region.start
+            while off < region.end:
+                slot = free.get()
+                if stop.is_set():
+                    return
+                n = min(chunk_size, region.end - off)
+                ready.put((off, memoryview(source.get(n, slot)), slot))
+                off += n
+            ready.put(None)
+        except BaseException as e:
+            ready.put(e)
+
+    batch: List[memoryview] = []
+    batch_slots: List[Optional[memoryview]] = []
+    flushed = region.start  # file offset of batch[0]
+    last_drop_off = region.start
+
+    def flush() -> None:
+        nonlocal flushed, last_drop_off
+        if not batch:
+            return
+        pwrite_all(fd, batch, flushed)
+        flushed += sum(len(b) for b in batch)
+        batch.clear()
+        for slot in batch_slots:
+            free.put(slot)
+        batch_slots.clear()
+        if drop_cache_linux and flushed - last_drop_off >= DROP_CACHE_INTERVAL:
+            linux_drop_page_cache_best_effort(
+                fd, flushed - last_drop_off, last_drop_off
+            )
+            last_drop_off = flushed
+
+    producer = threading.Thread(target=produce, name=f"{APP_NAME}-rng", daemon=True)
+    producer.start()
+    try:
+        # Writes are sequential and samples sorted, so only samples[active_lo:active_hi]
+        # can overlap the current chunk; both indices only move forward.
+        n_samples = len(samples)
+        sample_ends = [s.offset + s.length for s in samples]
+        active_lo = 0
+        active_hi = 0
+        while True:
+            item = ready.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            written, data, slot = item
+            n = len(data)
+
+            if samples:
+                chunk_end = written + n
+                while active_lo < n_samples and sample_ends[active_lo] <= written:
+                    active_lo += 1
+                while active_hi < n_samples and samples[active_hi].offset < chunk_end:
+                    active_hi += 1
+                if active_lo < active_hi:
+                    capture_expected_from_chunk(
+                        samples,
+                        expected,
+                        filled_count,
+                        data,
+                        written,
+                        active_lo,
+                        active_hi,
+                    )
+
+            if region.direct and n % DIRECT_IO_ALIGN:
+                # Unaligned tail of the file: write it through the page cache.
+                flush()
+                set_direct_io(fd, False)
+                pwrite_all(fd, [data], written)
+                set_direct_io(fd, True)
+                flushed += n
+                free.put(slot)
+            else:
+                batch.append(data)
+                batch_slots.append(slot)
+                if len(batch) == WRITE_BATCH:
+                    flush()
+
+        flush()
+    finally:
+        # Unblock a producer waiting for a free slot (error path) and wait for it.
+        stop.set()
+        free.put(None)
+        producer.join()
+
+
 def overwrite_random_streaming(
     path: Path,
     passes: int,
@@ -165,50 +554,116 @@ def overwrite_random_streaming(
     verify_samples: int,
     verify_len: int,
     drop_cache_linux: bool,
+    fsync_each_pass: bool = False,
+    o_direct: bool = False,
+    pass_threads: int = 1,
 ) -> None:
     size = path.stat().st_size
     if size == 0:
         return
 
-    with open(path, "r+b", buffering=0) as f:
+    f, direct = open_for_overwrite(path, o_direct)
+    with f, contextlib.ExitStack() as stack:
         fd = f.fileno()
+        linux_advise_sequential_best_effort(fd)
+
+        if direct:
+            chunk_size = max(DIRECT_IO_ALIGN, chunk_size - chunk_size % DIRECT_IO_ALIGN)
+            read_buf = mmap.mmap(-1, (verify_len // DIRECT_IO_ALIGN + 2) * DIRECT_IO_ALIGN)
+
+        # Split into pass_threads regions on chunk boundaries (so O_DIRECT alignment
+        # holds and only the last region has an unaligned tail). Each extra region
+        # gets its own fd and is written by its own thread.
+        n_chunks = -(-size // chunk_size)
+        threads = max(1, min(pass_threads, n_chunks))
+        per_region = -(-n_chunks // threads) * chunk_size
+        regions: List[_Region] = []
+        for start in range(0, size, per_region):
+            end = min(size, start + per_region)
+            if start == 0:
+                rf, rdirect = f, direct
+            else:
+                rf, rdirect = open_for_overwrite(path, direct)
+                stack.enter_context(rf)
+            regions.append(new_region(rf, rdirect, start, end, chunk_size))
+
+        executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        if len(regions) > 1:
+            executor = stack.enter_context(
+                concurrent.futures.ThreadPoolExecutor(max_workers=len(regions))
+            )
 
         for p in range(1, passes + 1):
-            samples = choose_samples(size, verify_samples, verify_len) if verify else []
-            expected: List[bytearray] = [bytearray(s.length) for s in samples]
-            filled: List[bytearray] = [bytearray(b"\x00" * s.length) for s in samples]
-
-            f.seek(0)
-            written = 0
-            while written < size:
-                n = min(chunk_size, size - written)
-                data = secrets.token_bytes(n)
-
-                if verify and samples:
-                    capture_expected_from_chunk(
-                        samples, expected, filled, data, written
-                    )
-
-                f.write(data)
-                written += n
+            # Fresh source (new key / pool) per region per pass, so no two ever share
+            # bytes. Each sample lands in a region picked at random, weighted by region
+            # length (a uniform position in the file), then is drawn inside that region
+            # so none straddles a boundary.
+            counts = [0] * len(regions)
+            if verify:
+                starts = [r.start for r in regions]
+                rnd = os.urandom(8 * verify_samples)
+                for (v,) in struct.iter_unpack("<Q", rnd):
+                    counts[bisect.bisect_right(starts, v % size) - 1] += 1
+            region_samples: List[List[Sample]] = []
+            for r, count in zip(regions, counts):
+                picked = choose_samples(r.end - r.start, count, verify_len)
+                region_samples.append(
+                    [Sample(offset=r.start + s.offset, length=s.length) for s in picked]
+                )
+            # All expected bytes for the pass live in one buffer; each sample gets a
+            # view of its own slice of it.
+            expected_buf = memoryview(
+                bytearray(sum(s.length for ss in region_samples for s in ss))
+            )
+            region_expected: List[List[memoryview]] = []
+            pos = 0
+            for ss in region_samples:
+                views = []
+                for s in ss:
+                    views.append(expected_buf[pos : pos + s.length])
+                    pos += s.length
+                region_expected.append(views)
+            region_filled = [[0] * len(ss) for ss in region_samples]
+
+            jobs = [
+                (r, chunk_size, ss, ex, fc, drop_cache_linux)
+                for r, ss, ex, fc in zip(
+                    regions, region_samples, region_expected, region_filled
+                )
+            ]
+            if executor is None:
+                overwrite_region(*jobs[0])
+            else:
+                for fut in [executor.submit(overwrite_region, *job) for job in jobs]:
+                    fut.result()
+
+            samples = [s for ss in region_samples for s in ss]
+            expected = [e for ex in region_expected for e in ex]
+            filled_count = [c for fc in region_filled for c in fc]
 
             f.flush()
-            os.fsync(fd)
+            # Every pass must reach the device, or the page cache would merge them into
+            # one. Intermediate passes only need their data flushed (size is unchanged),
+            # so fdatasync skips the metadata flush; the final pass gets a full fsync
+            # (it also lands before the rename/truncate metadata changes).
+            if fsync_each_pass or p == passes or not hasattr(os, "fdatasync"):
+                os.fsync(fd)
+            else:
+                os.fdatasync(fd)
 
             if drop_cache_linux:
                 linux_drop_page_cache_best_effort(fd, size)
 
             if verify and samples:
-                for m in filled:
-                    if not all_filled(m):
+                for i, s in enumerate(samples):
+                    if filled_count[i] != s.length:
                         raise RuntimeError(
                             "Internal verification capture failed (sample not fully captured)."
                         )
 
-                for i, s in enumerate(samples):
-                    f.seek(s.offset)
-                    got = f.read(s.length)
-                    if got != bytes(expected[i]):
+                got_all = read_samples(f, samples, direct, read_buf if direct else None)
+                for i, (s, got) in enumerate(zip(samples, got_all)):
+                    if got != expected[i]:
                         raise RuntimeError(
                             f"Verification failed on pass {p}: sample {i + 1} mismatch at offset {s.offset}"
                         )
@@ -216,8 +671,8 @@ def overwrite_random_streaming(
                 if drop_cache_linux:
                     linux_drop_page_cache_best_effort(fd, size)
 
-            print(
-                f"[*] {APP_NAME}: pass {p}/{passes} complete"
+            log(
+                f"[*] {APP_NAME}: {path}: pass {p}/{passes} complete"
                 + (" (verified)" if verify else "")
             )
 
@@ -225,6 +680,8 @@ def overwrite_random_streaming(
 def rename_truncate_unlink(path: Path, rename_passes: int, keep: bool) -> Path:
     current = path
 
+    # No directory fsync per rename: the intermediate names only need to obscure the
+    # original one, and the single fsync after truncate/unlink persists the final state.
     for _ in range(max(0, rename_passes)):
         new_name = rand_name_hex(16)
         candidate = current.with_name(new_name)
@@ -235,7 +692,6 @@ def rename_truncate_unlink(path: Path, rename_passes: int, keep: bool) -> Path:
             tries += 1
         current.rename(candidate)
         current = candidate
-        fsync_dir_best_effort(current.parent)
 
     try:
         with open(current, "r+b", buffering=0) as f:
@@ -266,6 +722,9 @@ def wipe_file(
     verify_len: int,
     rename_passes: int,
     drop_cache_linux: bool,
+    fsync_each_pass: bool,
+    o_direct: bool,
+    pass_threads: int,
     force: bool,
     keep: bool,
 ) -> None:
@@ -285,8 +744,9 @@ def wipe_file(
 
     passes = build_pass_count(min_passes, max_passes, randomize_pass_count)
     size = file_path.stat().st_size
-    print(
-        f"[*] {APP_NAME}: size={size} bytes | passes={passes} | chunk={chunk_size} bytes"
+    log(
+        f"[*] {APP_NAME}: {file_path}: size={size} bytes | passes={passes}"
+        f" | chunk={chunk_size} bytes"
     )
 
     if size > 0:
@@ -298,17 +758,22 @@ def wipe_file(
             verify_samples=verify_samples,
             verify_len=verify_len,
             drop_cache_linux=drop_cache_linux,
+            fsync_each_pass=fsync_each_pass,
+            o_direct=o_direct,
+            pass_threads=pass_threads,
         )
     else:
-        print(f"[*] {APP_NAME}: file is 0 bytes; skipping overwrites.")
+        log(f"[*] {APP_NAME}: {file_path}: file is 0 bytes; skipping overwrites.")
 
     final_path = rename_truncate_unlink(
         file_path, rename_passes=rename_passes, keep=keep
     )
     if keep:
-        print(f"[+] {APP_NAME}: completed overwrites. File kept at: {final_path}")
+        log(
+            f"[+] {APP_NAME}: {file_path}: completed overwrites. File kept at: {final_path}"
+        )
     else:
-        print(f"[+] {APP_NAME}: completed overwrites + delete.")
+        log(f"[+] {APP_NAME}: {file_path}: completed overwrites + delete.")
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -316,7 +781,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         prog=APP_NAME,
         description=f"{APP_NAME} — cross-platform streaming overwrite + delete (few passes, random, optional verification).",
     )
-    ap.add_argument("file", nargs="?", help="Path to file to shred")
+    ap.add_argument("files", nargs="*", help="Path(s) to file(s) to shred")
     ap.add_argument(
         "--pick", action="store_true", help="GUI file picker (if available)"
     )
@@ -363,19 +828,41 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument(
         "--drop-cache",
         action="store_true",
-        help="Linux only: posix_fadvise(DONTNEED) after each pass (best-effort)",
+        help="Linux only: posix_fadvise(DONTNEED) during and after each pass (best-effort)",
+    )
+    ap.add_argument(
+        "--pass-threads",
+        type=int,
+        default=1,
+        help="Split each pass into N regions written concurrently (default 1)",
+    )
+    ap.add_argument(
+        "--fsync-each-pass",
+        action="store_true",
+        help="Full fsync after every pass (default: fdatasync between passes, fsync after the last)",
+    )
+    ap.add_argument(
+        "--o-direct",
+        action="store_true",
+        help="Linux only: write with O_DIRECT, bypassing the page cache (falls back if unsupported)",
     )
     ap.add_argument(
         "--keep", action="store_true", help="Do not delete after shredding (testing)"
     )
     ap.add_argument("--force", action="store_true", help="Skip confirmation prompt")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Files to wipe in parallel (default 1; requires --force)",
+    )
     args = ap.parse_args(argv)
 
     # Build target list: either CLI file, or GUI picker (single or multi)
     targets: List[Path] = []
 
-    if args.file and not args.pick:
-        targets = [Path(args.file).expanduser()]
+    if args.files and not args.pick:
+        targets = [Path(f).expanduser() for f in args.files]
     else:
         # No file provided OR --pick explicitly requested -> use GUI picker
         try:
@@ -397,9 +884,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             print(f"[!] GUI picker unavailable ({e}). Provide a file path instead.")
             return 2
 
-    # Run wipe for each selected target; keep going even if one fails.
-    exit_code = 0
-    for t in targets:
+    def run_one(t: Path) -> int:
         try:
             wipe_file(
                 t,
@@ -412,12 +897,26 @@ def main(argv: Optional[List[str]] = None) -> int:
                 verify_len=max(1, args.verify_len),
                 rename_passes=max(0, args.rename_passes),
                 drop_cache_linux=args.drop_cache,
+                fsync_each_pass=args.fsync_each_pass,
+                o_direct=args.o_direct,
+                pass_threads=max(1, args.pass_threads),
                 force=args.force,
                 keep=args.keep,
             )
         except Exception as e:
-            print(f"[!] {APP_NAME}: failed on {t}: {e}", file=sys.stderr)
-            exit_code = 1
+            log(f"[!] {APP_NAME}: failed on {t}: {e}", sys.stderr)
+            return 1
+        return 0
+
+    # Run wipe for each selected target; keep going even if one fails.
+    # Parallel only with --force: the per-file confirmation prompt needs the console.
+    jobs = max(1, args.jobs) if args.force else 1
+    if jobs == 1 or len(targets) == 1:
+        results = [run_one(t) for t in targets]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(run_one, targets))
+    exit_code = 1 if any(results) else 0
 
     return exit_code
 
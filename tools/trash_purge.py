@@ -15,10 +15,13 @@ Safety:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import ctypes
 import datetime as dt
 import os
+import re
 import shutil
+import struct
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -29,6 +32,12 @@ IS_WINDOWS = os.name == "nt"
 IS_MAC = sys.platform == "darwin"
 IS_LINUX = sys.platform.startswith("linux")
 
+# $I file header: version, original size, deletion FILETIME (little-endian QWORDs)
+_I_HEADER = struct.Struct("<QQQ")
+
+# Path= / DeletionDate= lines of a .trashinfo file, matched in one scan of the raw bytes
+_TRASHINFO_FIELDS = re.compile(rb"(?m)^Path=(.*?)$|^DeletionDate=(.*?)$")
+
 # ---------------------------
 # Common structures/utilities
 # ---------------------------
@@ -44,16 +53,17 @@ class TrashItem:
     delete_targets: List[Path]  # paths to remove to purge item
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def fmt_size(n: Optional[int]) -> str:
     if n is None:
         return "?"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    x = float(n)
-    for u in units:
-        if x < 1024 or u == units[-1]:
-            return f"{x:.1f}{u}" if u != "B" else f"{int(x)}B"
-        x /= 1024
-    return f"{n}B"
+    # Unit index straight from the bit length: each unit is 10 more bits.
+    idx = min(max(0, (n.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    if idx == 0:
+        return f"{n}B"
+    return f"{n / (1 << (10 * idx)):.1f}{_SIZE_UNITS[idx]}"
 
 
 def safe_delete_path(p: Path) -> None:
@@ -65,6 +75,20 @@ def safe_delete_path(p: Path) -> None:
         p.unlink(missing_ok=True)
 
 
+def fsync_dir_best_effort(directory: Path) -> None:
+    """POSIX best-effort fsync of the directory to persist unlink metadata."""
+    if os.name != "posix":
+        return
+    try:
+        dfd = os.open(str(directory), os.O_RDONLY)
+        try:
+            os.fsync(dfd)
+        finally:
+            os.close(dfd)
+    except Exception:
+        pass
+
+
 def matches(item: TrashItem, needle: str) -> bool:
     n = needle.lower()
     return (
@@ -111,18 +135,16 @@ def win_parse_I_file(i_path: Path) -> Tuple[Optional[str], Optional[int], Option
         data = i_path.read_bytes()
         if len(data) < 0x18:
             return None, None, None
-        version = int.from_bytes(data[0:8], "little", signed=False)
-        size = int.from_bytes(data[8:16], "little", signed=False)
-        ftime = int.from_bytes(data[16:24], "little", signed=False)
+        version, size, ftime = _I_HEADER.unpack_from(data)
 
         # UTF-16LE path starting at 0x18
-        raw = data[24:]
-        # split at UTF-16 null terminator
+        start = _I_HEADER.size
+        # split at UTF-16 null terminator (a double-null on a code unit boundary)
         try:
-            # find double-null in bytes
-            end = raw.find(b"\x00\x00")
-            if end != -1:
-                raw = raw[: end + 2]
+            end = data.find(b"\x00\x00", start)
+            while end != -1 and (end - start) % 2:
+                end = data.find(b"\x00\x00", end + 1)
+            raw = data[start:end] if end != -1 else data[start:]
             orig_path = raw.decode("utf-16le", errors="ignore").rstrip("\x00")
         except Exception:
             orig_path = ""
@@ -141,27 +163,33 @@ def win_enumerate_recycle_items() -> List[TrashItem]:
             continue
 
         # SID subfolders (may include other users; we only list what we can access)
+        # scandir entries carry their file type, so is_dir()/is_file() need no stat.
         try:
-            sid_dirs = [p for p in base.iterdir() if p.is_dir()]
+            with os.scandir(base) as it:
+                sid_dirs = [Path(e.path) for e in it if e.is_dir(follow_symlinks=False)]
         except Exception:
             continue
 
         for sid in sid_dirs:
             try:
-                for entry in sid.iterdir():
+                with os.scandir(sid) as it:
+                    entries = list(it)
+                # Names present in this SID folder, to pair $I with $R without a stat each.
+                names = {e.name for e in entries}
+                for entry in entries:
                     name = entry.name
                     # We prefer parsing $I files to get original path info
-                    if name.startswith("$I") and entry.is_file():
+                    if name.startswith("$I") and entry.is_file(follow_symlinks=False):
                         suffix = name[2:]  # after $I
                         r_name = "$R" + suffix
-                        r_path = sid / r_name
+                        i_path = Path(entry.path)
 
-                        orig_path, size, deleted = win_parse_I_file(entry)
+                        orig_path, size, deleted = win_parse_I_file(i_path)
                         display = Path(orig_path).name if orig_path else r_name
 
-                        delete_targets = [entry]
-                        if r_path.exists():
-                            delete_targets.append(r_path)
+                        delete_targets = [i_path]
+                        if r_name in names:
+                            delete_targets.append(sid / r_name)
 
                         items.append(
                             TrashItem(
@@ -222,12 +250,12 @@ def linux_enumerate_trash_items() -> List[TrashItem]:
 
         if info.exists():
             try:
-                txt = info.read_text(encoding="utf-8", errors="ignore").splitlines()
-                for line in txt:
-                    if line.startswith("Path="):
-                        orig_path = unquote(line[len("Path="):].strip())
-                    elif line.startswith("DeletionDate="):
-                        deleted = line[len("DeletionDate="):].strip()
+                for m in _TRASHINFO_FIELDS.finditer(info.read_bytes()):
+                    path_raw, date_raw = m.groups()
+                    if path_raw is not None:
+                        orig_path = unquote(path_raw.decode("utf-8", errors="ignore").strip())
+                    else:
+                        deleted = date_raw.decode("utf-8", errors="ignore").strip()
             except Exception:
                 pass
 
@@ -369,14 +397,15 @@ def cmd_delete(match_text: str, dry_run: bool) -> int:
         print("\n[DRY RUN] Nothing deleted. Re-run with --force to permanently delete.")
         return 0
 
-    for it in targets:
-        for p in it.delete_targets:
-            safe_delete_path(p)
-        # best-effort dir fsync
-        try:
-            fsync_dir_best_effort(Path(it.recycle_location))
-        except Exception:
-            pass
+    # unlink/rmdir release the GIL, so delete in parallel; then one dir fsync
+    # per recycle location instead of one per item.
+    paths = [p for it in targets for p in it.delete_targets]
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(safe_delete_path, paths))
+
+    for loc in dict.fromkeys(it.recycle_location for it in targets):
+        fsync_dir_best_effort(Path(loc))
 
     print("[+] Deleted matched items permanently.")
     return 0